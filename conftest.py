@@ -0,0 +1,4 @@
+"""
+Pytest root configuration - puts the repository root on sys.path so the tests
+import pricing_engine and pricing_logic however pytest is invoked
+"""
@@ -1,44 +1,85 @@
-import json
 import re
-from typing import Dict, List, Any, Tuple
+import uuid
+from types import MappingProxyType
+from typing import Dict, List, Any, Final, Tuple, Union
 from datetime import datetime
+from pricing_logic.budget import Budget
 from pricing_logic.material_db import MaterialDB
 from pricing_logic.labor_calc import LaborCalculator
 from pricing_logic.vat_rules import VATCalculator
 
 
+CITY_MULTIPLIERS: Final = MappingProxyType({
+    'paris': 1.25,
+    'marseille': 1.0,
+    'lyon': 1.15,
+    'toulouse': 0.95,
+    'nice': 1.20,
+    'nantes': 1.05,
+    'bordeaux': 1.10
+})
+
+COMPLEX_TASKS: Final = frozenset({'plumbing', 'tile_removal', 'floor_installation'})
+
+
+def _price_task_kernel(materials_cost: float, labor_hours: float, labor_rate: float, margin_rate: float,
+                       vat_rate: float) -> Tuple[float, ...]:
+    """
+    Pure arithmetic core of task pricing, free of lookups and rounding
+    
+    Args:
+        materials_cost: Material cost in final currency
+        labor_hours: Labor hours for the task
+        labor_rate: Hourly rate in final currency
+        margin_rate: Margin rate as decimal
+        vat_rate: VAT rate as decimal
+    
+    Returns:
+        Tuple of (materials_cost, labor_cost, subtotal, margin_amount, vat_amount, total_price)
+    """
+    labor_cost = labor_hours * labor_rate
+    subtotal = materials_cost + labor_cost
+    margin_amount = subtotal * margin_rate
+    subtotal_with_margin = subtotal + margin_amount
+    vat_amount = subtotal_with_margin * vat_rate
+    total_price = subtotal_with_margin + vat_amount
+    
+    return materials_cost, labor_cost, subtotal, margin_amount, vat_amount, total_price
+
+
 class SmartPricingEngine:
+    __slots__ = ('material_db', 'labor_calc', 'vat_calc', 'base_margin', 'margin_protection_min',
+                 '_margin_table')
+    
+    city_multipliers = CITY_MULTIPLIERS
+    
     def __init__(self):
         self.material_db = MaterialDB()
         self.labor_calc = LaborCalculator()
         self.vat_calc = VATCalculator()
         
         
-        self.city_multipliers = {
-            'paris': 1.25,
-            'marseille': 1.0,
-            'lyon': 1.15,
-            'toulouse': 0.95,
-            'nice': 1.20,
-            'nantes': 1.05,
-            'bordeaux': 1.10
-        }
-        
-        
         self.base_margin = 0.20  
         self.margin_protection_min = 0.15  
+        
+        self._margin_table = {
+            (task, budget_pref): self._compute_dynamic_margin(task, budget_pref)
+            for task in self.labor_calc.labor_hours_data
+            for budget_pref in Budget
+        }
     
   
     def generate_quote(self, transcript: str) -> Dict[str, Any]:
         """Generate complete structured quote from transcript"""
         parsed_data = self.parse_transcript(transcript)
+        now = datetime.now()
         
         quote = {
-            'quote_id': f"QTE-{datetime.now().strftime('%Y%m%d-%H%M%S')}",
-            'generated_at': datetime.now().isoformat(),
+            'quote_id': f"QTE-{uuid.uuid4().hex[:12]}",
+            'generated_at': now.isoformat(),
             'client_info': {
                 'location': parsed_data['location'],
-                'budget_preference': parsed_data['budget_preference']
+                'budget_preference': parsed_data['budget_preference'].label
             },
             'project_details': {
                 'zone': parsed_data['room_type'],
@@ -53,106 +94,133 @@ class SmartPricingEngine:
             'confidence_flags': parsed_data['confidence_flags']
         }
         
-        zone_total = 0.0
-        zone_tasks = {}
+        tasks = parsed_data['tasks']
+        room_size = parsed_data['room_size']
+        location = parsed_data['location']
+        budget_pref = parsed_data['budget_preference']
         
-        for task in parsed_data['tasks']:
-            task_quote = self._calculate_task_pricing(
-                task, 
-                parsed_data['room_size'], 
-                parsed_data['location'],
-                parsed_data['budget_preference']
-            )
-            zone_tasks[task] = task_quote
-            zone_total += task_quote['total_price']
+        materials = self.material_db.get_material_costs_bulk(tasks, room_size, budget_pref)
+        labor_hours = self.labor_calc.calculate_labor_hours_bulk(tasks, room_size)
+        labor_rates = self.labor_calc.get_hourly_rates_bulk(tasks, location)
+        margin_rates = self._calculate_dynamic_margins(tasks, budget_pref)
+        vat_rates = self.vat_calc.get_vat_rates_bulk(tasks, 'france')
         
-        city_multiplier = self.city_multipliers.get(parsed_data['location'], 1.0)
-        zone_total *= city_multiplier
+        city_multiplier = self.city_multipliers.get(location, 1.0)
         
-        for task in zone_tasks:
-            zone_tasks[task]['total_price'] *= city_multiplier
-            zone_tasks[task]['city_multiplier'] = city_multiplier
+        (zone_tasks, total_materials, total_labor,
+         total_vat, zone_total) = self._calculate_zone_pricing(tasks, materials, labor_hours, labor_rates,
+                                                               margin_rates, vat_rates, city_multiplier)
         
         quote['pricing']['zones'][parsed_data['room_type']] = {
             'tasks': zone_tasks,
             'zone_total': round(zone_total, 2)
         }
         
-        total_materials = sum(task['materials_cost'] for task in zone_tasks.values())
-        total_labor = sum(task['labor_cost'] for task in zone_tasks.values())
         total_before_vat = total_materials + total_labor
-        total_vat = sum(task['vat_amount'] for task in zone_tasks.values())
         
         quote['pricing']['summary'] = {
-            'total_materials': round(total_materials * city_multiplier, 2),
-            'total_labor': round(total_labor * city_multiplier, 2),
-            'subtotal_before_vat': round(total_before_vat * city_multiplier, 2),
-            'total_vat': round(total_vat * city_multiplier, 2),
+            'total_materials': round(total_materials, 2),
+            'total_labor': round(total_labor, 2),
+            'subtotal_before_vat': round(total_before_vat, 2),
+            'total_vat': round(total_vat, 2),
             'total_price': round(zone_total, 2),
             'city_multiplier': city_multiplier,
-            'average_margin': self._calculate_average_margin(zone_tasks)
+            'average_margin': self._calculate_average_margin(margin_rates)
         }
         
         quote['confidence_score'] = self._calculate_confidence_score(parsed_data, zone_tasks)
         
         return quote
     
-    def _calculate_task_pricing(self, task: str, room_size: float, location: str, budget_pref: str) -> Dict[str, Any]:
-        """Calculate pricing for a specific task"""
-        materials_cost = self.material_db.get_material_cost(task, room_size, budget_pref)
-        labor_hours = self.labor_calc.calculate_labor_hours(task, room_size)
-        labor_rate = self.labor_calc.get_hourly_rate(location, task)
-        labor_cost = labor_hours * labor_rate
+    def _calculate_zone_pricing(self, tasks: List[str], materials: List[float], labor_hours: List[float],
+                                labor_rates: List[float], margin_rates: List[float],
+                                vat_rates: List[float],
+                                city_multiplier: float) -> Tuple[Dict[str, Dict[str, Any]], float, float, float, float]:
+        """
+        Calculate pricing for all tasks of a zone in a single pass over the gathered inputs
+        
+        Returns:
+            Tuple of (zone_tasks, total_materials, total_labor, total_vat, zone_total)
+        """
+        zone_tasks = {}
+        total_materials = 0.0
+        total_labor = 0.0
+        total_vat = 0.0
+        zone_total = 0.0
         
-        subtotal = materials_cost + labor_cost
-        margin_rate = self._calculate_dynamic_margin(task, budget_pref, subtotal)
-        margin_amount = subtotal * margin_rate
+        for task, materials_cost, hours, labor_rate, margin_rate, vat_rate in zip(
+                tasks, materials, labor_hours, labor_rates, margin_rates, vat_rates):
+            materials_cost *= city_multiplier
+            labor_rate *= city_multiplier
+            (materials_cost, labor_cost, subtotal, margin_amount,
+             vat_amount, total_price) = _price_task_kernel(materials_cost, hours, labor_rate,
+                                                           margin_rate, vat_rate)
+            
+            zone_tasks[task] = {
+                'task_name': task,
+                'materials_cost': round(materials_cost, 2),
+                'labor_hours': hours,
+                'labor_rate': round(labor_rate, 2),
+                'labor_cost': round(labor_cost, 2),
+                'subtotal': round(subtotal, 2),
+                'margin_rate': round(margin_rate, 3),
+                'margin_amount': round(margin_amount, 2),
+                'vat_rate': round(vat_rate, 3),
+                'vat_amount': round(vat_amount, 2),
+                'total_price': round(total_price, 2),
+                'estimated_duration_days': round(hours * 0.125, 1),
+                'city_multiplier': city_multiplier
+            }
+            
+            total_materials += materials_cost
+            total_labor += labor_cost
+            total_vat += vat_amount
+            zone_total += total_price
+        
+        return zone_tasks, total_materials, total_labor, total_vat, zone_total
+    
+    def _calculate_dynamic_margin(self, task: str, budget_pref: Union[Budget, str]) -> float:
+        """Look up the dynamic margin for a task and budget preference (tier or label)"""
+        return self._calculate_dynamic_margins((task,), budget_pref)[0]
+    
+    def _calculate_dynamic_margins(self, tasks: List[str], budget_pref: Union[Budget, str]) -> List[float]:
+        """Look up the dynamic margins for several tasks sharing one budget preference"""
+        if isinstance(budget_pref, str):
+            budget_pref = Budget.from_label(budget_pref)
         
-        subtotal_with_margin = subtotal + margin_amount
-        vat_rate = self.vat_calc.get_vat_rate(task, 'france')
-        vat_amount = subtotal_with_margin * vat_rate
+        margin_table = self._margin_table
+        margin_rates = []
         
-        total_price = subtotal_with_margin + vat_amount
+        for task in tasks:
+            margin_rate = margin_table.get((task, budget_pref))
+            if margin_rate is None:
+                margin_rate = self._compute_dynamic_margin(task, budget_pref)
+            margin_rates.append(margin_rate)
         
-        return {
-            'task_name': task,
-            'materials_cost': round(materials_cost, 2),
-            'labor_hours': labor_hours,
-            'labor_rate': labor_rate,
-            'labor_cost': round(labor_cost, 2),
-            'subtotal': round(subtotal, 2),
-            'margin_rate': round(margin_rate, 3),
-            'margin_amount': round(margin_amount, 2),
-            'vat_rate': round(vat_rate, 3),
-            'vat_amount': round(vat_amount, 2),
-            'total_price': round(total_price, 2),
-            'estimated_duration_days': round(labor_hours / 8, 1)
-        }
+        return margin_rates
     
-    def _calculate_dynamic_margin(self, task: str, budget_pref: str, subtotal: float) -> float:
+    def _compute_dynamic_margin(self, task: str, budget_pref: Budget) -> float:
         """Calculate dynamic margin based on task complexity and budget preference"""
         base_margin = self.base_margin
         
-        if budget_pref == 'budget_conscious':
+        if budget_pref == Budget.BUDGET_CONSCIOUS:
             base_margin *= 0.8  
-        elif budget_pref == 'premium':
+        elif budget_pref == Budget.PREMIUM:
             base_margin *= 1.3  
         
         
-        complex_tasks = ['plumbing', 'tile_removal', 'floor_installation']
-        if task in complex_tasks:
+        if task in COMPLEX_TASKS:
             base_margin *= 1.1  
         
         
         return max(base_margin, self.margin_protection_min)
     
-    def _calculate_average_margin(self, zone_tasks: Dict[str, Any]) -> float:
+    def _calculate_average_margin(self, margin_rates: List[float]) -> float:
         """Calculate average margin across all tasks"""
-        if not zone_tasks:
+        if not margin_rates:
             return 0.0
         
-        total_margin = sum(task['margin_rate'] for task in zone_tasks.values())
-        return round(total_margin / len(zone_tasks), 3)
+        return round(sum(margin_rates) / len(margin_rates), 3)
      
     def _calculate_confidence_score(self, parsed_data: Dict[str, Any], zone_tasks: Dict[str, Any]) -> float:
         """Calculate overall confidence score for the quote"""
@@ -186,11 +254,11 @@ class SmartPricingEngine:
         location = next((loc for loc in locations if loc in transcript), 'marseille')  
         
         if 'budget-conscious' in transcript or 'cheap' in transcript:
-            budget_preference = 'budget_conscious'
+            budget_preference = Budget.BUDGET_CONSCIOUS
         elif 'premium' in transcript or 'high-end' in transcript:
-            budget_preference = 'premium'
+            budget_preference = Budget.PREMIUM
         else:
-            budget_preference = 'standard'
+            budget_preference = Budget.STANDARD
         
         
         task_keywords = {
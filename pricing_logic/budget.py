@@ -0,0 +1,24 @@
+"""
+Budget Tiers - Handles client budget preferences
+"""
+
+from enum import IntEnum
+
+
+class Budget(IntEnum):
+    BUDGET_CONSCIOUS = 0
+    STANDARD = 1
+    PREMIUM = 2
+
+    @property
+    def label(self) -> str:
+        """Name of the tier as used in data files and quote output"""
+        return self.name.lower()
+
+    @classmethod
+    def from_label(cls, label: str) -> 'Budget':
+        """Get the tier for a label such as 'budget_conscious'"""
+        try:
+            return cls[label.upper()]
+        except KeyError:
+            raise ValueError(f"Unknown budget preference: {label!r}") from None
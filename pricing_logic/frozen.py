@@ -0,0 +1,17 @@
+"""
+Frozen Data - Handles read-only copies of static pricing tables
+"""
+
+from types import MappingProxyType
+from typing import Any
+
+
+def freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    
+    return value
@@ -2,101 +2,123 @@
 Labor Calculator - Handles labor time estimation and hourly rates
 """
 
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Final, List
+from pricing_logic.frozen import freeze
+
+
+LABOR_HOURS_DATA: Final = freeze({
+    'tile_removal': {
+        'base_hours': 2.0,  
+        'hours_per_m2': 1.5,  
+        'difficulty_multiplier': 1.0,
+        'skill_level': 'general'
+    },
+    'plumbing': {
+        'base_hours': 4.0,  
+        'hours_per_m2': 2.5,  
+        'difficulty_multiplier': 1.4,
+        'skill_level': 'specialized'
+    },
+    'toilet_replacement': {
+        'base_hours': 3.0,
+        'hours_per_m2': 0.0,  
+        'difficulty_multiplier': 1.1,
+        'skill_level': 'general'
+    },
+    'vanity_installation': {
+        'base_hours': 4.0,
+        'hours_per_m2': 1.0,
+        'difficulty_multiplier': 1.2,
+        'skill_level': 'general'
+    },
+    'painting': {
+        'base_hours': 1.0,
+        'hours_per_m2': 0.8,  
+        'difficulty_multiplier': 0.9,
+        'skill_level': 'general'
+    },
+    'floor_installation': {
+        'base_hours': 3.0,
+        'hours_per_m2': 2.0,
+        'difficulty_multiplier': 1.3,
+        'skill_level': 'specialized'
+    },
+    'general_renovation': {
+        'base_hours': 8.0,
+        'hours_per_m2': 3.0,
+        'difficulty_multiplier': 1.0,
+        'skill_level': 'general'
+    }
+})
+
+HOURLY_RATES: Final = freeze({
+    'paris': {
+        'general': 45.0,
+        'specialized': 65.0,
+        'expert': 85.0
+    },
+    'marseille': {
+        'general': 35.0,
+        'specialized': 50.0,
+        'expert': 70.0
+    },
+    'lyon': {
+        'general': 40.0,
+        'specialized': 58.0,
+        'expert': 78.0
+    },
+    'toulouse': {
+        'general': 32.0,
+        'specialized': 46.0,
+        'expert': 65.0
+    },
+    'nice': {
+        'general': 42.0,
+        'specialized': 60.0,
+        'expert': 80.0
+    },
+    'nantes': {
+        'general': 38.0,
+        'specialized': 54.0,
+        'expert': 74.0
+    },
+    'bordeaux': {
+        'general': 39.0,
+        'specialized': 56.0,
+        'expert': 76.0
+    }
+})
+
+COMPLEXITY_MULTIPLIERS: Final = freeze({
+    'small_room': 1.1,  
+    'standard_room': 1.0,
+    'large_room': 0.95,  
+    'difficult_access': 1.3,
+    'old_building': 1.2,
+    'new_construction': 0.9
+})
+
+_FLAT_LABOR_RATE: Final = MappingProxyType({
+    (city, task): city_rates[task_data['skill_level']]
+    for city, city_rates in HOURLY_RATES.items()
+    for task, task_data in LABOR_HOURS_DATA.items()
+})
+
+_HOURS_PARAMS: Final = MappingProxyType({
+    task: (task_data['base_hours'], task_data['hours_per_m2'], task_data['difficulty_multiplier'])
+    for task, task_data in LABOR_HOURS_DATA.items()
+})
+
 
 class LaborCalculator:
-    def __init__(self):
-        self.labor_hours_data = {
-            'tile_removal': {
-                'base_hours': 2.0,  
-                'hours_per_m2': 1.5,  
-                'difficulty_multiplier': 1.0,
-                'skill_level': 'general'
-            },
-            'plumbing': {
-                'base_hours': 4.0,  
-                'hours_per_m2': 2.5,  
-                'difficulty_multiplier': 1.4,
-                'skill_level': 'specialized'
-            },
-            'toilet_replacement': {
-                'base_hours': 3.0,
-                'hours_per_m2': 0.0,  
-                'difficulty_multiplier': 1.1,
-                'skill_level': 'general'
-            },
-            'vanity_installation': {
-                'base_hours': 4.0,
-                'hours_per_m2': 1.0,
-                'difficulty_multiplier': 1.2,
-                'skill_level': 'general'
-            },
-            'painting': {
-                'base_hours': 1.0,
-                'hours_per_m2': 0.8,  
-                'difficulty_multiplier': 0.9,
-                'skill_level': 'general'
-            },
-            'floor_installation': {
-                'base_hours': 3.0,
-                'hours_per_m2': 2.0,
-                'difficulty_multiplier': 1.3,
-                'skill_level': 'specialized'
-            },
-            'general_renovation': {
-                'base_hours': 8.0,
-                'hours_per_m2': 3.0,
-                'difficulty_multiplier': 1.0,
-                'skill_level': 'general'
-            }
-        }
-        
-        self.hourly_rates = {
-            'paris': {
-                'general': 45.0,
-                'specialized': 65.0,
-                'expert': 85.0
-            },
-            'marseille': {
-                'general': 35.0,
-                'specialized': 50.0,
-                'expert': 70.0
-            },
-            'lyon': {
-                'general': 40.0,
-                'specialized': 58.0,
-                'expert': 78.0
-            },
-            'toulouse': {
-                'general': 32.0,
-                'specialized': 46.0,
-                'expert': 65.0
-            },
-            'nice': {
-                'general': 42.0,
-                'specialized': 60.0,
-                'expert': 80.0
-            },
-            'nantes': {
-                'general': 38.0,
-                'specialized': 54.0,
-                'expert': 74.0
-            },
-            'bordeaux': {
-                'general': 39.0,
-                'specialized': 56.0,
-                'expert': 76.0
-            }
-        }
-        
-        self.complexity_multipliers = {
-            'small_room': 1.1,  
-            'standard_room': 1.0,
-            'large_room': 0.95,  
-            'difficult_access': 1.3,
-            'old_building': 1.2,
-            'new_construction': 0.9
-        }
+    __slots__ = ()
+    
+    labor_hours_data = LABOR_HOURS_DATA
+    hourly_rates = HOURLY_RATES
+    complexity_multipliers = COMPLEXITY_MULTIPLIERS
+    _flat_labor_rate = _FLAT_LABOR_RATE
+    _hours_params = _HOURS_PARAMS
     
     def calculate_labor_hours(self, task: str, room_size: float, complexity_factors: list = None) -> float:
         """
@@ -110,51 +132,85 @@ class LaborCalculator:
         Returns:
             Total labor hours required
         """
-        if task not in self.labor_hours_data:
-            return max(4.0, room_size * 2.0)
-        
-        task_data = self.labor_hours_data[task]
-        
-        base_hours = task_data['base_hours']
-        variable_hours = task_data['hours_per_m2'] * room_size
-        difficulty_multiplier = task_data['difficulty_multiplier']
-        
-        total_hours = (base_hours + variable_hours) * difficulty_multiplier
+        return self.calculate_labor_hours_bulk((task,), room_size, complexity_factors)[0]
+    
+    def calculate_labor_hours_bulk(self, tasks: List[str], room_size: float,
+                                   complexity_factors: list = None) -> List[float]:
+        """
+        Calculate labor hours for several tasks in the same room
         
-        if complexity_factors:
-            for factor in complexity_factors:
-                if factor in self.complexity_multipliers:
-                    total_hours *= self.complexity_multipliers[factor]
+        Args:
+            tasks: Types of renovation tasks
+            room_size: Room size in square meters
+            complexity_factors: List of complexity factors affecting the job
         
+        Returns:
+            Labor hours per task, in the order of tasks
+        """
+        hours_params_by_task = self._hours_params
+        multipliers = [self.complexity_multipliers[factor] for factor in complexity_factors or ()
+                       if factor in self.complexity_multipliers]
+        room_size_factor = self._room_size_factor(room_size)
+        fallback_hours = max(4.0, room_size * 2.0)
+        hours = []
+        
+        for task in tasks:
+            hours_params = hours_params_by_task.get(task)
+            if hours_params is None:
+                hours.append(fallback_hours)
+                continue
+            
+            base_hours, hours_per_m2, difficulty_multiplier = hours_params
+            total_hours = (base_hours + hours_per_m2 * room_size) * difficulty_multiplier
+            for multiplier in multipliers:
+                total_hours *= multiplier
+            total_hours *= room_size_factor
+            hours.append(round(total_hours, 2))
+        
+        return hours
+    
+    def _room_size_factor(self, room_size: float) -> float:
+        """Get the labor multiplier for small and large rooms"""
         if room_size < 5:
-            total_hours *= self.complexity_multipliers['small_room']
+            return self.complexity_multipliers['small_room']
         elif room_size > 15:
-            total_hours *= self.complexity_multipliers['large_room']
+            return self.complexity_multipliers['large_room']
         
-        return round(total_hours, 2)
+        return 1.0
     
     def get_hourly_rate(self, city: str, task: str) -> float:
         """
         Get hourly rate for a task in a specific city
         
         Args:
-            city: City name
+            city: City name (unknown cities use the Marseille rates)
             task: Type of renovation task
         
         Returns:
             Hourly rate in euros
         """
-        city_lower = city.lower()
+        return self.get_hourly_rates_bulk((task,), city)[0]
+    
+    def get_hourly_rates_bulk(self, tasks: List[str], city: str) -> List[float]:
+        """
+        Get hourly rates for several tasks in one city
         
-        if city_lower not in self.hourly_rates:
-            city_lower = 'marseille'
+        Args:
+            tasks: Types of renovation tasks
+            city: City name (unknown cities use the Marseille rates)
+        
+        Returns:
+            Hourly rates in euros, in the order of tasks
+        """
+        if city not in self.hourly_rates:
+            city = city.lower()
+            if city not in self.hourly_rates:
+                city = 'marseille'
         
-        if task in self.labor_hours_data:
-            skill_level = self.labor_hours_data[task]['skill_level']
-        else:
-            skill_level = 'general'
+        flat_labor_rate = self._flat_labor_rate
+        general_rate = self.hourly_rates[city]['general']
         
-        return self.hourly_rates[city_lower][skill_level]
+        return [flat_labor_rate.get((city, task), general_rate) for task in tasks]
     
     def calculate_labor_cost(self, task: str, room_size: float, city: str, 
                            complexity_factors: list = None) -> Dict[str, Any]:
@@ -182,6 +238,6 @@ class LaborCalculator:
             'total_labor_cost': round(total_cost, 2),
             'skill_level_required': self.labor_hours_data.get(task, {}).get('skill_level', 'general'),
             'complexity_factors': complexity_factors or [],
-            'estimated_days': round(hours / 8, 1)  
+            'estimated_days': round(hours * 0.125, 1)  
         }
   
\ No newline at end of file
@@ -3,48 +3,119 @@ Material Database - Handles material costs and inventory
 """
 
 import json
-from typing import Dict, Any
+from pathlib import Path
+from types import MappingProxyType
+from typing import Final, List, Union
+from pricing_logic.budget import Budget
+from pricing_logic.frozen import freeze
+
+
+MATERIALS_PATH = Path(__file__).resolve().parent.parent / 'data' / 'materials.json'
+
+
+def _load_materials(path: Path = MATERIALS_PATH) -> MappingProxyType:
+    """Load the materials file as a deeply read-only mapping"""
+    with open(path, 'r') as f:
+        return freeze(json.load(f))
+
+
+_MATERIALS_DATA: Final = _load_materials()
+
+_TIER_COSTS: Final = MappingProxyType({
+    task: tuple(
+        (tiers[budget.label].get('base_cost', 0.0), tiers[budget.label].get('cost_per_m2', 0.0))
+        for budget in Budget
+    )
+    for task, tiers in _MATERIALS_DATA.items()
+    if all(budget.label in tiers for budget in Budget)
+})
+
+_TIER_ITEMS: Final = MappingProxyType({
+    (task, budget): _MATERIALS_DATA[task][budget.label].get('items', ())
+    for task in _TIER_COSTS
+    for budget in Budget
+})
+
+_FALLBACK_COST_PER_M2: Final = (30, 50, 80)
+
+
+def _fallback_cost_per_m2(budget_preference: Union[Budget, str]) -> float:
+    """Get the flat rate for tasks without material data, using the standard rate for unknown labels"""
+    if isinstance(budget_preference, str):
+        try:
+            budget_preference = Budget.from_label(budget_preference)
+        except ValueError:
+            budget_preference = Budget.STANDARD
+    
+    return _FALLBACK_COST_PER_M2[budget_preference]
 
 
 class MaterialDB:
+    __slots__ = ('materials_data',)
+    
+    _tier_costs = _TIER_COSTS
+    _tier_items = _TIER_ITEMS
+    
     def __init__(self):
-        with open('data/materials.json', 'r') as f:
-            self.materials_data = json.load(f)
+        self.materials_data = _MATERIALS_DATA
     
-    def get_material_cost(self, task: str, room_size: float, budget_preference: str = 'standard') -> float:
+    def get_material_cost(self, task: str, room_size: float,
+                          budget_preference: Union[Budget, str] = Budget.STANDARD) -> float:
         """
         Calculate material cost for a specific task
         
         Args:
             task: Type of renovation task
             room_size: Room size in square meters
-            budget_preference: budget_conscious, standard, or premium
+            budget_preference: Budget tier (labels such as 'premium' are also accepted)
         
         Returns:
             Total material cost in euros
         """
-        if task not in self.materials_data:
-            base_cost_per_m2 = {'budget_conscious': 30, 'standard': 50, 'premium': 80}
-            return room_size * base_cost_per_m2.get(budget_preference, 50)
-        
-        task_data = self.materials_data[task][budget_preference]
+        return self.get_material_costs_bulk((task,), room_size, budget_preference)[0]
+    
+    def get_material_costs_bulk(self, tasks: List[str], room_size: float,
+                                budget_preference: Union[Budget, str] = Budget.STANDARD) -> List[float]:
+        """
+        Calculate material costs for several tasks in the same room
         
-        total_cost = 0.0
+        Args:
+            tasks: Types of renovation tasks
+            room_size: Room size in square meters
+            budget_preference: Budget tier (labels such as 'premium' are also accepted)
         
-        if 'base_cost' in task_data:
-            total_cost += task_data['base_cost']
+        Returns:
+            Material costs in euros, in the order of tasks
+        """
+        tier_costs_by_task = self._tier_costs
+        tier = None
+        fallback_cost = None
+        costs = []
         
-        if 'cost_per_m2' in task_data:
-            total_cost += task_data['cost_per_m2'] * room_size
+        for task in tasks:
+            tier_costs = tier_costs_by_task.get(task)
+            if tier_costs is None:
+                if fallback_cost is None:
+                    fallback_cost = room_size * _fallback_cost_per_m2(budget_preference)
+                costs.append(fallback_cost)
+                continue
+            
+            if tier is None:
+                tier = Budget.from_label(budget_preference) if isinstance(budget_preference, str) else budget_preference
+            base_cost, cost_per_m2 = tier_costs[tier]
+            costs.append(base_cost + cost_per_m2 * room_size)
         
-        return total_cost
+        return costs
     
-    def get_material_list(self, task: str, budget_preference: str = 'standard') -> list:
+    def get_material_list(self, task: str, budget_preference: Union[Budget, str] = Budget.STANDARD) -> list:
         """Get list of materials needed for a task"""
-        if task not in self.materials_data:
+        if task not in self._tier_costs:
             return ['general supplies']
         
-        return self.materials_data[task][budget_preference].get('items', [])
+        if isinstance(budget_preference, str):
+            budget_preference = Budget.from_label(budget_preference)
+        
+        return list(self._tier_items[(task, budget_preference)])
     
     def get_all_tasks(self) -> list:
         """Get list of all available tasks"""
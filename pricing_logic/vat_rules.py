@@ -2,110 +2,136 @@
 VAT Rules Calculator - Handles country and task-specific VAT calculations
 """
 
-from typing import Dict, Any,List
-from datetime import datetime
+from collections import defaultdict
+from types import MappingProxyType
+from typing import Dict, Any,List, Final, Tuple
+from pricing_logic.frozen import freeze
 
 
-class VATCalculator:
-    def __init__(self):
-        self.vat_rates = {
-            'france': {
-                'standard': 0.20,  
-                'reduced': 0.10,   
-                'super_reduced': 0.055,  
-                'zero': 0.0        
-            },
-            'germany': {
-                'standard': 0.19,
-                'reduced': 0.07,
-                'zero': 0.0
-            },
-            'spain': {
-                'standard': 0.21,
-                'reduced': 0.10,
-                'super_reduced': 0.04,
-                'zero': 0.0
-            },
-            'italy': {
-                'standard': 0.22,
-                'reduced': 0.10,
-                'super_reduced': 0.04,
-                'zero': 0.0
-            }
-        }
-        
-        
-        self.task_vat_categories = {
-            'tile_removal': {
-                'france': 'reduced',    
-                'germany': 'standard',
-                'spain': 'reduced',
-                'italy': 'reduced'
-            },
-            'plumbing': {
-                'france': 'reduced',    
-                'germany': 'standard',
-                'spain': 'reduced',
-                'italy': 'reduced'
-            },
-            'toilet_replacement': {
-                'france': 'standard',   
-                'germany': 'standard',
-                'spain': 'standard',
-                'italy': 'standard'
-            },
-            'vanity_installation': {
-                'france': 'standard',   
-                'germany': 'standard',
-                'spain': 'standard',
-                'italy': 'standard'
-            },
-            'painting': {
-                'france': 'reduced',    
-                'germany': 'standard',
-                'spain': 'reduced',
-                'italy': 'reduced'
-            },
-            'floor_installation': {
-                'france': 'reduced',    
-                'germany': 'standard',
-                'spain': 'reduced',
-                'italy': 'reduced'
-            },
-            'general_renovation': {
-                'france': 'reduced',    
-                'germany': 'standard',
-                'spain': 'reduced',
-                'italy': 'reduced'
-            },
-            'energy_efficiency': {
-                'france': 'super_reduced',  
-                'germany': 'reduced',
-                'spain': 'super_reduced',
-                'italy': 'super_reduced'
-            }
-        }
-        
-        
-        self.vat_conditions = {
-            'building_age': {
-                'old_building': {  
-                    'france': {'renovation_discount': True, 'rate_reduction': 0.10}
-                }
-            },
-            'accessibility_improvements': {
-                'france': 'super_reduced',  
-                'germany': 'reduced',
-                'spain': 'super_reduced',
-                'italy': 'super_reduced'
-            },
-            'energy_certification': {
-                'france': 'super_reduced',  
-                'germany': 'reduced',
-                'spain': 'super_reduced',
-                'italy': 'super_reduced'
-            }
+VAT_RATES: Final = freeze({
+    'france': {
+        'standard': 0.20,  
+        'reduced': 0.10,   
+        'super_reduced': 0.055,  
+        'zero': 0.0        
+    },
+    'germany': {
+        'standard': 0.19,
+        'reduced': 0.07,
+        'zero': 0.0
+    },
+    'spain': {
+        'standard': 0.21,
+        'reduced': 0.10,
+        'super_reduced': 0.04,
+        'zero': 0.0
+    },
+    'italy': {
+        'standard': 0.22,
+        'reduced': 0.10,
+        'super_reduced': 0.04,
+        'zero': 0.0
+    }
+})
+
+TASK_VAT_CATEGORIES: Final = freeze({
+    'tile_removal': {
+        'france': 'reduced',    
+        'germany': 'standard',
+        'spain': 'reduced',
+        'italy': 'reduced'
+    },
+    'plumbing': {
+        'france': 'reduced',    
+        'germany': 'standard',
+        'spain': 'reduced',
+        'italy': 'reduced'
+    },
+    'toilet_replacement': {
+        'france': 'standard',   
+        'germany': 'standard',
+        'spain': 'standard',
+        'italy': 'standard'
+    },
+    'vanity_installation': {
+        'france': 'standard',   
+        'germany': 'standard',
+        'spain': 'standard',
+        'italy': 'standard'
+    },
+    'painting': {
+        'france': 'reduced',    
+        'germany': 'standard',
+        'spain': 'reduced',
+        'italy': 'reduced'
+    },
+    'floor_installation': {
+        'france': 'reduced',    
+        'germany': 'standard',
+        'spain': 'reduced',
+        'italy': 'reduced'
+    },
+    'general_renovation': {
+        'france': 'reduced',    
+        'germany': 'standard',
+        'spain': 'reduced',
+        'italy': 'reduced'
+    },
+    'energy_efficiency': {
+        'france': 'super_reduced',  
+        'germany': 'reduced',
+        'spain': 'super_reduced',
+        'italy': 'super_reduced'
+    }
+})
+
+VAT_CONDITIONS: Final = freeze({
+    'building_age': {
+        'old_building': {  
+            'france': {'renovation_discount': True, 'rate_reduction': 0.10}
         }
+    },
+    'accessibility_improvements': {
+        'france': 'super_reduced',  
+        'germany': 'reduced',
+        'spain': 'super_reduced',
+        'italy': 'super_reduced'
+    },
+    'energy_certification': {
+        'france': 'super_reduced',  
+        'germany': 'reduced',
+        'spain': 'super_reduced',
+        'italy': 'super_reduced'
+    }
+})
+
+_FLAT_VAT: Final = MappingProxyType({
+    (task, country): country_rates[task_categories.get(country, 'standard')]
+    for task, task_categories in TASK_VAT_CATEGORIES.items()
+    for country, country_rates in VAT_RATES.items()
+})
+
+
+def _build_rate_to_category() -> Dict[Tuple[str, float], str]:
+    """Map (country, rounded rate) to the first VAT category with that rate"""
+    rate_to_category = {}
+    for country, country_rates in VAT_RATES.items():
+        for category, rate in country_rates.items():
+            rate_to_category.setdefault((country, round(rate, 4)), category)
+    return rate_to_category
+
+
+_RATE_TO_CATEGORY: Final = MappingProxyType(_build_rate_to_category())
+
+
+class VATCalculator:
+    __slots__ = ()
+    
+    vat_rates = VAT_RATES
+    task_vat_categories = TASK_VAT_CATEGORIES
+    vat_conditions = VAT_CONDITIONS
+    _flat_vat = _FLAT_VAT
+    _rate_to_category = _RATE_TO_CATEGORY
     
     def get_vat_rate(self, task: str, country: str = 'france', 
                      conditions: Dict[str, Any] = None) -> float:
@@ -114,26 +140,53 @@ class VATCalculator:
         
         Args:
             task: Type of renovation task
-            country: Country code (lowercase)
+            country: Country code (unknown countries use the French rates)
             conditions: Special conditions affecting VAT
         
         Returns:
             VAT rate as decimal (e.g., 0.20 for 20%)
         """
+        if not conditions:
+            return self.get_vat_rates_bulk((task,), country)[0]
+        
         country_lower = country.lower()
         
         if country_lower not in self.vat_rates:
             country_lower = 'france'
         
-        vat_category = 'standard'  
-        if task in self.task_vat_categories:
-            vat_category = self.task_vat_categories[task].get(country_lower, 'standard')
-        
-        if conditions:
-            vat_category = self._apply_vat_conditions(vat_category, country_lower, conditions)
+        vat_category = self._get_task_vat_category(task, country_lower)
+        vat_category = self._apply_vat_conditions(vat_category, country_lower, conditions)
         
         return self.vat_rates[country_lower][vat_category]
     
+    def get_vat_rates_bulk(self, tasks: List[str], country: str = 'france') -> List[float]:
+        """
+        Get unconditional VAT rates for several tasks in one country
+        
+        Args:
+            tasks: Types of renovation tasks
+            country: Country code (unknown countries use the French rates)
+        
+        Returns:
+            VAT rates as decimals, in the order of tasks
+        """
+        if country not in self.vat_rates:
+            country = country.lower()
+            if country not in self.vat_rates:
+                country = 'france'
+        
+        flat_vat = self._flat_vat
+        standard_rate = self.vat_rates[country]['standard']
+        
+        return [flat_vat.get((task, country), standard_rate) for task in tasks]
+    
+    def _get_task_vat_category(self, task: str, country_lower: str) -> str:
+        """Get the base VAT category of a task in a country"""
+        if task in self.task_vat_categories:
+            return self.task_vat_categories[task].get(country_lower, 'standard')
+        
+        return 'standard'
+    
     def _apply_vat_conditions(self, base_category: str, country: str, 
                             conditions: Dict[str, Any]) -> str:
         """Apply special conditions to determine final VAT category"""
@@ -182,13 +235,12 @@ class VATCalculator:
     def _get_vat_category_name(self, task: str, country: str, conditions: Dict[str, Any] = None) -> str:
         """Get human-readable VAT category name"""
         vat_rate = self.get_vat_rate(task, country, conditions)
-        country_rates = self.vat_rates.get(country.lower(), self.vat_rates['france'])
+        country_lower = country.lower()
         
-        for category, rate in country_rates.items():
-            if abs(rate - vat_rate) < 0.001:  
-                return category
+        if country_lower not in self.vat_rates:
+            country_lower = 'france'
         
-        return 'standard'
+        return self._rate_to_category.get((country_lower, round(vat_rate, 4)), 'standard')
     
     def get_vat_summary_by_tasks(self, tasks_costs: Dict[str, float], 
                                 country: str = 'france', conditions: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -203,33 +255,38 @@ class VATCalculator:
         Returns:
             Complete VAT summary
         """
+        country_lower = country.lower()
+        category_country = country_lower if country_lower in self.vat_rates else 'france'
+        
         vat_breakdown = {}
+        vat_groups = defaultdict(lambda: {'vat_percentage': 0.0, 'base_amount': 0.0, 'vat_amount': 0.0, 'tasks': []})
         total_base = 0.0
         total_vat = 0.0
         
         for task, cost in tasks_costs.items():
-            task_vat = self.calculate_vat_amount(cost, task, country, conditions)
-            vat_breakdown[task] = task_vat
+            vat_rate = self.get_vat_rate(task, country_lower, conditions)
+            vat_amount = cost * vat_rate
+            
+            vat_breakdown[task] = {
+                'base_amount': round(cost, 2),
+                'vat_rate': round(vat_rate, 3),
+                'vat_percentage': round(vat_rate * 100, 1),
+                'vat_amount': round(vat_amount, 2),
+                'total_amount': round(cost + vat_amount, 2),
+                'country': country,
+                'task': task,
+                'vat_category': self._rate_to_category.get((category_country, round(vat_rate, 4)), 'standard')
+            }
+            
+            rate_group = vat_groups[round(vat_rate, 3)]
+            rate_group['base_amount'] += cost
+            rate_group['vat_amount'] += vat_amount
+            rate_group['tasks'].append(task)
             total_base += cost
-            total_vat += task_vat['vat_amount']
-        
-        
-        vat_groups = {}
-        for task, vat_data in vat_breakdown.items():
-            rate = vat_data['vat_rate']
-            if rate not in vat_groups:
-                vat_groups[rate] = {
-                    'vat_percentage': vat_data['vat_percentage'],
-                    'base_amount': 0.0,
-                    'vat_amount': 0.0,
-                    'tasks': []
-                }
-            vat_groups[rate]['base_amount'] += vat_data['base_amount']
-            vat_groups[rate]['vat_amount'] += vat_data['vat_amount']
-            vat_groups[rate]['tasks'].append(task)
-        
+            total_vat += vat_amount
         
-        for rate_group in vat_groups.values():
+        for rate, rate_group in vat_groups.items():
+            rate_group['vat_percentage'] = round(rate * 100, 1)
             rate_group['base_amount'] = round(rate_group['base_amount'], 2)
             rate_group['vat_amount'] = round(rate_group['vat_amount'], 2)
         
@@ -238,7 +295,7 @@ class VATCalculator:
             'total_base_amount': round(total_base, 2),
             'total_vat_amount': round(total_vat, 2),
             'total_with_vat': round(total_base + total_vat, 2),
-            'vat_groups': vat_groups,
+            'vat_groups': dict(vat_groups),
             'task_breakdown': vat_breakdown,
             'conditions_applied': conditions or {}
         }
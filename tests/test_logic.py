@@ -0,0 +1,265 @@
+import pytest
+
+from pricing_engine import SmartPricingEngine
+from pricing_logic.budget import Budget
+from pricing_logic.labor_calc import LaborCalculator
+from pricing_logic.material_db import MaterialDB
+from pricing_logic.vat_rules import VATCalculator
+
+
+LYON_TRANSCRIPT = (
+    "Premium bathroom of 12.7 m2 in Lyon: remove old tiles, redo plumbing for shower, "
+    "replace toilet, install vanity, repaint walls and lay new floor tiles."
+)
+
+TASK_PRECISION = {
+    'materials_cost': 2,
+    'labor_rate': 2,
+    'labor_cost': 2,
+    'subtotal': 2,
+    'margin_rate': 3,
+    'margin_amount': 2,
+    'vat_rate': 3,
+    'vat_amount': 2,
+    'total_price': 2,
+    'estimated_duration_days': 1
+}
+
+
+def _lyon_quote():
+    engine = SmartPricingEngine()
+    return engine, engine.generate_quote(LYON_TRANSCRIPT)
+
+
+def test_task_fields_are_rounded_to_their_precision():
+    _, quote = _lyon_quote()
+    tasks = quote['pricing']['zones']['bathroom']['tasks']
+
+    assert len(tasks) == 6
+    for task_quote in tasks.values():
+        for field, ndigits in TASK_PRECISION.items():
+            assert task_quote[field] == round(task_quote[field], ndigits), field
+
+
+def test_summary_fields_are_rounded_to_their_precision():
+    _, quote = _lyon_quote()
+    summary = quote['pricing']['summary']
+
+    for field in ('total_materials', 'total_labor', 'subtotal_before_vat', 'total_vat', 'total_price'):
+        assert summary[field] == round(summary[field], 2), field
+    assert summary['average_margin'] == round(summary['average_margin'], 3)
+
+
+def test_task_fields_are_scaled_by_city_multiplier():
+    engine, quote = _lyon_quote()
+    tasks = quote['pricing']['zones']['bathroom']['tasks']
+    city_multiplier = engine.city_multipliers['lyon']
+
+    for task, task_quote in tasks.items():
+        materials = engine.material_db.get_material_cost(task, 12.7, Budget.PREMIUM)
+        hourly_rate = engine.labor_calc.get_hourly_rate('lyon', task)
+
+        assert task_quote['city_multiplier'] == city_multiplier
+        assert task_quote['materials_cost'] == round(materials * city_multiplier, 2)
+        assert task_quote['labor_rate'] == round(hourly_rate * city_multiplier, 2)
+    assert quote['pricing']['summary']['city_multiplier'] == city_multiplier
+
+
+def test_summary_totals_sum_unrounded_task_amounts():
+    engine, quote = _lyon_quote()
+    tasks = quote['pricing']['zones']['bathroom']['tasks']
+    city_multiplier = engine.city_multipliers['lyon']
+
+    raw_materials = sum(
+        engine.material_db.get_material_cost(task, 12.7, Budget.PREMIUM) * city_multiplier
+        for task in tasks
+    )
+    raw_margins = [engine._calculate_dynamic_margin(task, Budget.PREMIUM) for task in tasks]
+
+    summary = quote['pricing']['summary']
+    assert summary['total_materials'] == round(raw_materials, 2)
+    assert summary['average_margin'] == round(sum(raw_margins) / len(raw_margins), 3)
+    assert summary['total_price'] == quote['pricing']['zones']['bathroom']['zone_total']
+
+
+def test_vat_amount_precision():
+    vat = VATCalculator().calculate_vat_amount(123.4567, 'energy_efficiency', 'france')
+
+    assert vat['base_amount'] == 123.46
+    assert vat['vat_rate'] == 0.055
+    assert vat['vat_percentage'] == 5.5
+    assert vat['vat_amount'] == round(123.4567 * 0.055, 2)
+    assert vat['total_amount'] == round(123.4567 * 1.055, 2)
+    assert vat['vat_category'] == 'super_reduced'
+
+
+def test_vat_summary_rounds_groups_and_keeps_conditions_as_passed():
+    conditions = {'building_age_years': 5, 'discount_ratio': 0.123456}
+    summary = VATCalculator().get_vat_summary_by_tasks(
+        {'plumbing': 1234.567, 'painting': 99.995, 'toilet_replacement': 333.333},
+        'france',
+        conditions
+    )
+
+    assert summary['conditions_applied'] == {'building_age_years': 5, 'discount_ratio': 0.123456}
+    assert summary['total_base_amount'] == round(1234.567 + 99.995 + 333.333, 2)
+    assert summary['total_vat_amount'] == round((1234.567 + 99.995 + 333.333) * 0.10, 2)
+    assert list(summary['vat_groups']) == [0.1]
+    assert summary['vat_groups'][0.1]['vat_percentage'] == 10.0
+    assert summary['vat_groups'][0.1]['tasks'] == ['plumbing', 'painting', 'toilet_replacement']
+
+
+def test_budget_labels_round_trip():
+    assert [budget.label for budget in Budget] == ['budget_conscious', 'standard', 'premium']
+    for budget in Budget:
+        assert Budget.from_label(budget.label) is budget
+
+
+def test_budget_from_unknown_label_raises_value_error():
+    with pytest.raises(ValueError, match='luxury'):
+        Budget.from_label('luxury')
+
+
+def test_parse_transcript_emits_budget_and_quote_reports_label():
+    engine = SmartPricingEngine()
+
+    assert engine.parse_transcript('cheap bathroom in nice')['budget_preference'] is Budget.BUDGET_CONSCIOUS
+    assert engine.parse_transcript('bathroom in nice')['budget_preference'] is Budget.STANDARD
+
+    quote = engine.generate_quote(LYON_TRANSCRIPT)
+    assert quote['client_info']['budget_preference'] == 'premium'
+
+
+def test_margin_lookup_accepts_labels_and_tiers():
+    engine = SmartPricingEngine()
+
+    for task in ('plumbing', 'painting', 'sauna_installation'):
+        for budget in Budget:
+            assert engine._calculate_dynamic_margin(task, budget.label) == \
+                engine._calculate_dynamic_margin(task, budget)
+    assert engine._calculate_dynamic_margin('plumbing', 'premium') == 0.2 * 1.3 * 1.1
+
+    with pytest.raises(ValueError):
+        engine._calculate_dynamic_margin('plumbing', 'luxury')
+
+
+def test_material_lookups_accept_labels_and_tiers():
+    material_db = MaterialDB()
+
+    assert material_db.get_material_cost('plumbing', 4.0, 'premium') == 600.0
+    assert material_db.get_material_cost('plumbing', 4.0, Budget.PREMIUM) == 600.0
+    assert material_db.get_material_list('plumbing', 'premium') == material_db.get_material_list('plumbing', Budget.PREMIUM)
+
+
+def test_unknown_task_falls_back_for_any_label():
+    material_db = MaterialDB()
+
+    assert material_db.get_material_cost('sauna_installation', 4.0, 'premium') == 320
+    assert material_db.get_material_cost('sauna_installation', 4.0, 'luxury') == 200
+    assert material_db.get_material_list('sauna_installation', 'luxury') == ['general supplies']
+
+
+def test_known_task_with_unknown_label_raises_value_error():
+    material_db = MaterialDB()
+
+    with pytest.raises(ValueError):
+        material_db.get_material_cost('plumbing', 4.0, 'luxury')
+    with pytest.raises(ValueError):
+        material_db.get_material_list('plumbing', 'luxury')
+
+
+def test_material_list_is_a_private_copy():
+    items = MaterialDB().get_material_list('plumbing')
+    items.append('gold taps')
+
+    assert 'gold taps' not in MaterialDB().get_material_list('plumbing')
+
+
+def test_static_tables_are_read_only_at_every_level():
+    with pytest.raises(TypeError):
+        LaborCalculator.hourly_rates['paris']['general'] = 0.0
+    with pytest.raises(TypeError):
+        LaborCalculator.labor_hours_data['plumbing']['base_hours'] = 0.0
+    with pytest.raises(TypeError):
+        VATCalculator.vat_rates['france']['reduced'] = 0.0
+    with pytest.raises(TypeError):
+        VATCalculator.task_vat_categories['plumbing']['france'] = 'zero'
+    with pytest.raises(TypeError):
+        MaterialDB().materials_data['plumbing']['standard']['base_cost'] = 0.0
+
+    assert LaborCalculator().get_hourly_rate('paris', 'painting') == 45.0
+
+
+BULK_TASKS = [
+    'tile_removal', 'plumbing', 'toilet_replacement', 'vanity_installation',
+    'painting', 'floor_installation', 'general_renovation', 'sauna_installation'
+]
+
+
+@pytest.mark.parametrize('room_size', [3.0, 5.0, 12.7, 15.0, 22.5])
+@pytest.mark.parametrize('budget_preference', [*Budget, 'standard'])
+def test_bulk_material_costs_match_scalar(room_size, budget_preference):
+    material_db = MaterialDB()
+
+    assert material_db.get_material_costs_bulk(BULK_TASKS, room_size, budget_preference) == [
+        material_db.get_material_cost(task, room_size, budget_preference) for task in BULK_TASKS
+    ]
+
+
+@pytest.mark.parametrize('room_size', [3.0, 5.0, 12.7, 15.0, 22.5])
+def test_bulk_labor_hours_match_scalar(room_size):
+    labor_calc = LaborCalculator()
+
+    assert labor_calc.calculate_labor_hours_bulk(BULK_TASKS, room_size) == [
+        labor_calc.calculate_labor_hours(task, room_size) for task in BULK_TASKS
+    ]
+
+
+@pytest.mark.parametrize('country', ['france', 'germany', 'Spain', 'portugal'])
+def test_bulk_vat_rates_match_scalar(country):
+    vat_calc = VATCalculator()
+
+    assert vat_calc.get_vat_rates_bulk(BULK_TASKS, country) == [
+        vat_calc.get_vat_rate(task, country) for task in BULK_TASKS
+    ]
+
+
+@pytest.mark.parametrize('complexity_factors', [None, ['old_building'], ['difficult_access', 'new_construction', 'unknown']])
+def test_bulk_labor_hours_with_complexity_factors_match_scalar(complexity_factors):
+    labor_calc = LaborCalculator()
+
+    for room_size in (3.0, 12.7, 22.5):
+        assert labor_calc.calculate_labor_hours_bulk(BULK_TASKS, room_size, complexity_factors) == [
+            labor_calc.calculate_labor_hours(task, room_size, complexity_factors) for task in BULK_TASKS
+        ]
+
+
+@pytest.mark.parametrize('city', ['paris', 'Lyon', 'BORDEAUX', 'grenoble'])
+def test_bulk_hourly_rates_match_scalar(city):
+    labor_calc = LaborCalculator()
+
+    assert labor_calc.get_hourly_rates_bulk(BULK_TASKS, city) == [
+        labor_calc.get_hourly_rate(city, task) for task in BULK_TASKS
+    ]
+
+
+def test_hourly_and_vat_rates_fall_back_per_batch():
+    assert LaborCalculator().get_hourly_rates_bulk(['plumbing', 'sauna_installation'], 'Grenoble') == [50.0, 35.0]
+    assert VATCalculator().get_vat_rates_bulk(['plumbing', 'sauna_installation'], 'Portugal') == [0.10, 0.20]
+
+
+@pytest.mark.parametrize('budget_preference', [*Budget, 'premium'])
+def test_bulk_margins_match_scalar(budget_preference):
+    engine = SmartPricingEngine()
+
+    assert engine._calculate_dynamic_margins(BULK_TASKS, budget_preference) == [
+        engine._calculate_dynamic_margin(task, budget_preference) for task in BULK_TASKS
+    ]
+
+
+def test_bulk_material_costs_only_convert_label_for_known_tasks():
+    material_db = MaterialDB()
+
+    assert material_db.get_material_costs_bulk(['sauna_installation', 'steam_room'], 4.0, 'luxury') == [200, 200]
+    with pytest.raises(ValueError):
+        material_db.get_material_costs_bulk(['sauna_installation', 'plumbing'], 4.0, 'luxury')